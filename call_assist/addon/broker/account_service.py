@@ -6,7 +6,9 @@ This module handles account status checking and other business logic,
 using dependency injection for clean separation of concerns.
 """
 
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Annotated
 
 from fastapi import Depends
@@ -18,6 +20,7 @@ from addon.broker.dependencies import (
     get_database_session,
     get_plugin_manager,
 )
+from addon.broker.models import Account
 from addon.broker.plugin_manager import PluginManager
 from addon.broker.queries import get_all_accounts_with_session
 
@@ -38,28 +41,29 @@ class AccountService:
     async def get_accounts_with_status(self) -> list[AccountStatusData]:
         """Get all accounts with real-time status check from plugins"""
         accounts = get_all_accounts_with_session(self.session)
-        accounts_with_status = []
 
+        # Each plugin holds a single client, so accounts sharing a protocol are
+        # checked one at a time; only different plugins are checked concurrently
+        accounts_by_protocol: dict[str, list[Account]] = defaultdict(list)
         for account in accounts:
-            # Check real-time status using plugin manager
-            try:
-                # Try to initialize the plugin account to check if credentials are valid
-                is_valid = await self.plugin_manager.initialize_plugin_account(
-                    protocol=account.protocol,
-                    account_id=account.account_id,
-                    display_name=account.display_name,
-                    credentials=account.credentials,
-                )
-                logger.debug(
-                    f"Account {account.account_id} status check: {'valid' if is_valid else 'invalid'}"
-                )
-            except (TimeoutError, GRPCError, ConnectionError, OSError) as e:
-                logger.error(
-                    f"Error checking status for account {account.account_id}: {e}"
-                )
-                is_valid = False
-
-            account_status = AccountStatusData(
+            accounts_by_protocol[account.protocol].append(account)
+
+        protocol_statuses = await asyncio.gather(
+            *(
+                self._check_accounts_in_order(protocol_accounts)
+                for protocol_accounts in accounts_by_protocol.values()
+            )
+        )
+        status_by_key = {
+            (account.protocol, account.account_id): is_valid
+            for protocol_accounts, results in zip(
+                accounts_by_protocol.values(), protocol_statuses, strict=True
+            )
+            for account, is_valid in zip(protocol_accounts, results, strict=True)
+        }
+
+        return [
+            AccountStatusData(
                 id=account.id,
                 protocol=account.protocol,
                 account_id=account.account_id,
@@ -74,11 +78,22 @@ class AccountService:
                     if account.updated_at
                     else ""
                 ),
-                is_valid=is_valid,
+                is_valid=status_by_key[(account.protocol, account.account_id)],
             )
-            accounts_with_status.append(account_status)
+            for account in accounts
+        ]
 
-        return accounts_with_status
+    async def _check_accounts_in_order(self, accounts: list[Account]) -> list[bool]:
+        """Check the status of several accounts one after another"""
+        return [
+            await self.check_account_status(
+                protocol=account.protocol,
+                account_id=account.account_id,
+                display_name=account.display_name,
+                credentials=account.credentials,
+            )
+            for account in accounts
+        ]
 
     async def check_account_status(
         self,
@@ -98,7 +113,9 @@ class AccountService:
             )
 
             logger.debug(
-                f"Account {account_id} status check: {'valid' if is_valid else 'invalid'}"
+                "Account %s status check: %s",
+                account_id,
+                "valid" if is_valid else "invalid",
             )
             return is_valid
 
@@ -2,9 +2,12 @@
 
 import asyncio
 import contextlib
+import itertools
 import logging
+import sys
+from collections import Counter
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, cast
 
@@ -12,7 +15,10 @@ import betterproto.lib.pydantic.google.protobuf as betterproto_lib_google
 import grpclib
 
 from addon.broker.plugin_manager import PluginManager
-from addon.broker.queries import get_enabled_call_stations_with_session
+from addon.broker.queries import (
+    get_data_version,
+    get_enabled_call_stations_with_session,
+)
 
 # Import betterproto generated classes
 from proto_gen.callassist.broker import (
@@ -24,14 +30,46 @@ from proto_gen.callassist.broker import (
     StartCallRequest,
     StartCallResponse,
 )
+from proto_gen.callassist.common import MediaCapabilities, Resolution
+from proto_gen.callassist.plugin import CallStartRequest
 
 if TYPE_CHECKING:
     from addon.broker.database import DatabaseManager
+    from addon.broker.models import CallStation as CallStationConfig
 
 logger = logging.getLogger(__name__)
 
+# Entity type values used for every broker entity update
+CALL_STATION_ENTITY_TYPE = cast(BrokerEntityType, BrokerEntityType.CALL_STATION)
+BROKER_STATUS_ENTITY_TYPE = cast(BrokerEntityType, BrokerEntityType.BROKER_STATUS)
+
+# Media capabilities sent with every call start request; they never change
+CAMERA_CAPABILITIES = MediaCapabilities(
+    video_codecs=["H264", "VP8"],
+    audio_codecs=["OPUS", "PCMU"],
+    supported_resolutions=[
+        Resolution(width=640, height=480, framerate=10),
+        Resolution(width=1280, height=720, framerate=30),
+    ],
+    hardware_acceleration=False,
+    webrtc_support=True,
+    max_bandwidth_kbps=2000,
+)
+
+PLAYER_CAPABILITIES = MediaCapabilities(
+    video_codecs=["H264", "VP8", "VP9"],
+    audio_codecs=["OPUS", "AAC"],
+    supported_resolutions=[
+        Resolution(width=1920, height=1080, framerate=30),
+        Resolution(width=1280, height=720, framerate=30),
+    ],
+    hardware_acceleration=True,
+    webrtc_support=True,
+    max_bandwidth_kbps=10000,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class HAEntity:
     """Represents a Home Assistant entity we're monitoring"""
 
@@ -45,7 +83,7 @@ class HAEntity:
     ha_base_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CallStation:
     """Represents a call station (camera + media player combination)"""
 
@@ -55,10 +93,11 @@ class CallStation:
     media_player_entity_id: str
     state: str = "idle"
     available: bool = True
+    # Built once per station and shared by every update sent for it
+    attributes: dict[str, str] = field(init=False, repr=False, compare=False)
 
-    @property
-    def attributes(self) -> dict[str, str]:
-        return {
+    def __post_init__(self) -> None:
+        self.attributes = {
             "camera_entity": self.camera_entity_id,
             "media_player_entity": self.media_player_entity_id,
             "station_type": "call_station",
@@ -84,21 +123,26 @@ class CallAssistBroker(BrokerIntegrationBase):
         # Store call stations we create
         self.call_stations: dict[str, CallStation] = {}
 
+        # Enabled call station rows, reloaded only when the database changes
+        self._station_configs: list[CallStationConfig] = []
+        self._station_configs_version: int | None = None
+
         # Track broker entity update subscribers
         self.broker_entity_subscribers: list[asyncio.Queue[BrokerEntityUpdate]] = []
 
         # Startup time for health check
         self.startup_time = datetime.now(UTC)
 
+        # Call IDs are unique per broker run: startup timestamp plus a counter
+        self._call_id_prefix = self.startup_time.strftime("%Y%m%d_%H%M%S")
+        self._call_counter = itertools.count(1)
+
         # Initialize plugin manager (injected or create new)
         self.plugin_manager = plugin_manager or PluginManager()
 
         # Store database manager reference (injected or None)
         self.database_manager = database_manager
 
-        # Cache HA base URL for URL transformation
-        self._ha_base_url: str | None = None
-
     def _resolve_camera_stream_url(self, url: str, ha_base_url: str) -> str:
         """Transform relative camera URL to absolute URL using HA base URL."""
         if not url or not ha_base_url:
@@ -121,30 +165,36 @@ class CallAssistBroker(BrokerIntegrationBase):
         logger.info("Starting to receive HA entity updates")
 
         async for entity_update in ha_entity_update_iterator:
-            # Cache HA base URL from first entity update
-            if not self._ha_base_url and entity_update.ha_base_url:
-                self._ha_base_url = entity_update.ha_base_url
-                logger.info(f"Cached HA base URL: {self._ha_base_url}")
-
             # Create HA entity
             ha_entity = HAEntity(
                 entity_id=entity_update.entity_id,
-                domain=entity_update.domain,
+                # Few distinct domains; share one string object per domain
+                domain=sys.intern(entity_update.domain),
                 name=entity_update.name,
                 state=entity_update.state,
-                attributes=dict(entity_update.attributes),
+                attributes=entity_update.attributes,
                 available=entity_update.available,
                 last_updated=entity_update.last_updated,
                 ha_base_url=entity_update.ha_base_url,
             )
 
+            previous = self.ha_entities.get(entity_update.entity_id)
             self.ha_entities[entity_update.entity_id] = ha_entity
             logger.info(
-                f"Received HA entity update: {entity_update.entity_id} ({entity_update.domain}) - {entity_update.state}"
+                "Received HA entity update: %s (%s) - %s",
+                entity_update.entity_id,
+                entity_update.domain,
+                entity_update.state,
             )
 
-            # Update call stations when we get new camera or media_player entities
-            await self._update_call_stations()
+            # Call stations only depend on which entities exist and are available,
+            # plus their stored configuration; skip the rebuild otherwise
+            if (
+                previous is None
+                or previous.available != ha_entity.available
+                or get_data_version() != self._station_configs_version
+            ):
+                await self._update_call_stations()
 
         return betterproto_lib_google.Empty()
 
@@ -195,19 +245,20 @@ class CallAssistBroker(BrokerIntegrationBase):
     ) -> StartCallResponse:
         """Start a call using the specified call station and contact."""
         logger.info(
-            f"Starting call from {start_call_request.call_station_id} to {start_call_request.contact}"
+            "Starting call from %s to %s",
+            start_call_request.call_station_id,
+            start_call_request.contact,
         )
 
         # Validate call station exists
-        if start_call_request.call_station_id not in self.call_stations:
+        station = self.call_stations.get(start_call_request.call_station_id)
+        if station is None:
             return StartCallResponse(
                 success=False,
                 message=f"Call station '{start_call_request.call_station_id}' not found",
                 call_id="",
             )
 
-        station = self.call_stations[start_call_request.call_station_id]
-
         # Check if call station is available
         if not station.available:
             return StartCallResponse(
@@ -217,12 +268,12 @@ class CallAssistBroker(BrokerIntegrationBase):
             )
 
         # Generate a unique call ID
-        call_id = f"call_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{start_call_request.call_station_id}"
+        call_id = f"call_{self._call_id_prefix}_{next(self._call_counter)}_{station.station_id}"
 
-        try:
-            # Update call station state
-            station.state = "calling"
+        # Update call station state
+        station.state = "calling"
 
+        try:
             # Notify subscribers of state change
             await self._notify_entity_changes()
 
@@ -230,33 +281,32 @@ class CallAssistBroker(BrokerIntegrationBase):
             success = await self._initiate_plugin_call(
                 call_id, station, start_call_request.contact
             )
-
-            if not success:
-                station.state = "idle"  # Reset state on failure
-                await self._notify_entity_changes()
-                return StartCallResponse(
-                    success=False,
-                    message="Failed to initiate call through protocol plugins",
-                    call_id="",
-                )
-
-            logger.info(f"Call {call_id} started successfully")
-
-            return StartCallResponse(
-                success=True,
-                message=f"Call started successfully to {start_call_request.contact}",
-                call_id=call_id,
-            )
-
-        except Exception as ex:
-            logger.error(f"Failed to start call: {ex}")
+        except Exception as e:
+            # Unexpected errors reach the client as a gRPC INTERNAL status
+            logger.exception("Failed to start call %s", call_id)
             station.state = "idle"  # Reset state on error
+            await self._notify_entity_changes()
+            raise grpclib.exceptions.GRPCError(
+                grpclib.const.Status.INTERNAL, f"Failed to start call: {e}"
+            ) from e
+
+        if not success:
+            station.state = "idle"  # Reset state on failure
+            await self._notify_entity_changes()
             return StartCallResponse(
                 success=False,
-                message=f"Failed to start call: {str(ex)}",
+                message="Failed to initiate call through protocol plugins",
                 call_id="",
             )
 
+        logger.info("Call %s started successfully", call_id)
+
+        return StartCallResponse(
+            success=True,
+            message=f"Call started successfully to {start_call_request.contact}",
+            call_id=call_id,
+        )
+
     async def _update_call_stations(self) -> None:
         """Update call stations based on database configuration and HA entity availability"""
         if not self.database_manager:
@@ -265,206 +315,191 @@ class CallAssistBroker(BrokerIntegrationBase):
             )
             return
 
-        # Load call stations from database
-        new_stations = {}
-        with self.database_manager.get_session() as session:
-            db_stations = get_enabled_call_stations_with_session(session)
+        # Load call stations from database, unless nothing was written since
+        data_version = get_data_version()
+        if data_version != self._station_configs_version:
+            # Query in a worker thread so SQLite I/O doesn't stall the streams
+            self._station_configs = await asyncio.to_thread(
+                self._load_station_configs, self.database_manager
+            )
+            self._station_configs_version = data_version
+
+        new_stations: dict[str, CallStation] = {}
+        changed = False
+        for db_station in self._station_configs:
+            # Update availability based on both entities existing and being available
+            camera = self.ha_entities.get(db_station.camera_entity_id)
+            player = self.ha_entities.get(db_station.media_player_entity_id)
+            available = (
+                camera is not None
+                and camera.available
+                and player is not None
+                and player.available
+            )
 
-            for db_station in db_stations:
+            # Keep the existing object for an unchanged station so its call
+            # state survives the rebuild and in-flight calls update the live one
+            previous = self.call_stations.get(db_station.station_id)
+            station = previous
+            if (
+                station is not None
+                and station.name == db_station.display_name
+                and station.camera_entity_id == db_station.camera_entity_id
+                and station.media_player_entity_id == db_station.media_player_entity_id
+            ):
+                if station.available != available:
+                    station.available = available
+                    changed = True
+            else:
                 # Create in-memory CallStation object
                 station = CallStation(
                     station_id=db_station.station_id,
                     name=db_station.display_name,
                     camera_entity_id=db_station.camera_entity_id,
                     media_player_entity_id=db_station.media_player_entity_id,
+                    state=previous.state if previous else "idle",
+                    available=available,
                 )
-
-                # Update availability based on both entities existing and being available
-                camera_available = (
-                    db_station.camera_entity_id in self.ha_entities
-                    and self.ha_entities[db_station.camera_entity_id].available
-                )
-                player_available = (
-                    db_station.media_player_entity_id in self.ha_entities
-                    and self.ha_entities[db_station.media_player_entity_id].available
-                )
-
-                station.available = camera_available and player_available
-                new_stations[db_station.station_id] = station
+                changed = True
+            new_stations[db_station.station_id] = station
 
         # Check if stations changed
-        if new_stations != self.call_stations:
+        if changed or new_stations.keys() != self.call_stations.keys():
             self.call_stations = new_stations
-            logger.info(f"Updated call stations: {len(self.call_stations)} stations")
+            logger.info("Updated call stations: %d stations", len(self.call_stations))
 
             # Notify subscribers of changes
             await self._notify_entity_changes()
 
-    async def _send_initial_entities(
-        self, update_queue: asyncio.Queue[BrokerEntityUpdate]
-    ) -> None:
-        """Send initial entities to a new subscriber"""
-        # Send call stations
-        for station in self.call_stations.values():
-            entity_update = BrokerEntityUpdate(
+    @staticmethod
+    def _load_station_configs(
+        database_manager: "DatabaseManager",
+    ) -> list["CallStationConfig"]:
+        """Load enabled call station configurations from the database"""
+        with database_manager.get_session() as session:
+            return get_enabled_call_stations_with_session(session)
+
+    def _build_call_station_updates(self) -> list[BrokerEntityUpdate]:
+        """Build one entity update per call station, shared by all subscribers"""
+        now = datetime.now(UTC)
+        return [
+            BrokerEntityUpdate(
                 entity_id=station.station_id,
                 name=station.name,
-                entity_type=cast(BrokerEntityType, BrokerEntityType.CALL_STATION),
+                entity_type=CALL_STATION_ENTITY_TYPE,
                 state=station.state,
                 attributes=station.attributes,
                 icon="mdi:video-account",
                 available=station.available,
                 capabilities=["make_call"],
-                last_updated=datetime.now(UTC),
+                last_updated=now,
             )
+            for station in self.call_stations.values()
+        ]
+
+    async def _send_initial_entities(
+        self, update_queue: asyncio.Queue[BrokerEntityUpdate]
+    ) -> None:
+        """Send initial entities to a new subscriber"""
+        # Send call stations
+        for entity_update in self._build_call_station_updates():
             await update_queue.put(entity_update)
 
-        # Send broker status
+        # Send broker status, counting monitored entities in a single pass
+        domain_counts = Counter(entity.domain for entity in self.ha_entities.values())
+        now = datetime.now(UTC)
         broker_status = BrokerEntityUpdate(
             entity_id="broker_status",
             name="Call Assist Broker",
-            entity_type=cast(BrokerEntityType, BrokerEntityType.BROKER_STATUS),
+            entity_type=BROKER_STATUS_ENTITY_TYPE,
             state="online",
             attributes={
-                "monitored_cameras": str(
-                    len([e for e in self.ha_entities.values() if e.domain == "camera"])
-                ),
-                "monitored_players": str(
-                    len(
-                        [
-                            e
-                            for e in self.ha_entities.values()
-                            if e.domain == "media_player"
-                        ]
-                    )
-                ),
+                "monitored_cameras": str(domain_counts["camera"]),
+                "monitored_players": str(domain_counts["media_player"]),
                 "call_stations": str(len(self.call_stations)),
-                "uptime_seconds": str(
-                    (datetime.now(UTC) - self.startup_time).total_seconds()
-                ),
+                "uptime_seconds": str((now - self.startup_time).total_seconds()),
             },
             icon="mdi:video-switch",
             available=True,
             capabilities=[],
-            last_updated=datetime.now(UTC),
+            last_updated=now,
         )
         await update_queue.put(broker_status)
 
     async def _notify_entity_changes(self) -> None:
         """Notify all subscribers of entity changes"""
+        if not self.broker_entity_subscribers:
+            return
+
+        # Build the updates once; every subscriber gets the same messages
+        entity_updates = self._build_call_station_updates()
+
         for update_queue in self.broker_entity_subscribers:
             try:
                 # Send updated call stations
-                for station in self.call_stations.values():
-                    entity_update = BrokerEntityUpdate(
-                        entity_id=station.station_id,
-                        name=station.name,
-                        entity_type=cast(
-                            BrokerEntityType, BrokerEntityType.CALL_STATION
-                        ),
-                        state=station.state,
-                        attributes=station.attributes,
-                        icon="mdi:video-account",
-                        available=station.available,
-                        capabilities=["make_call"],
-                        last_updated=datetime.now(UTC),
-                    )
+                for entity_update in entity_updates:
                     await update_queue.put(entity_update)
 
             except asyncio.CancelledError:
                 # Re-raise cancellation to propagate properly
                 raise
             except Exception as e:
-                logger.error(f"Error notifying subscriber: {e}")
+                logger.error("Error notifying subscriber: %s", e)
                 # Continue with next subscriber
 
     async def _initiate_plugin_call(
         self, call_id: str, station: CallStation, contact: str
     ) -> bool:
         """Initiate a call through the appropriate protocol plugin"""
-        try:
-            # Determine protocol from contact format
-            protocol = self._detect_protocol_from_contact(contact)
-            if not protocol:
-                logger.error(f"Could not determine protocol for contact: {contact}")
-                return False
-
-            # Get camera stream URL from HA entity attributes
-            camera_entity = self.ha_entities.get(station.camera_entity_id)
-            if not camera_entity:
-                logger.error(f"Camera entity {station.camera_entity_id} not found")
-                return False
-
-            # Get camera stream URL and transform to absolute if needed
-            camera_stream_url = camera_entity.attributes.get("stream_source", "")
-            if not camera_stream_url and "entity_picture" in camera_entity.attributes:
-                # Try to construct stream URL from entity picture URL
-                camera_stream_url = camera_entity.attributes["entity_picture"].replace(
-                    "/camera_proxy/", "/camera_proxy_stream/"
-                )
-
-            if not camera_stream_url:
-                logger.error(
-                    f"No stream source found for camera {station.camera_entity_id}"
-                )
-                return False
+        # Determine protocol from contact format
+        protocol = self._detect_protocol_from_contact(contact)
+        if not protocol:
+            logger.error("Could not determine protocol for contact: %s", contact)
+            return False
 
-            # Ensure camera_stream_url is absolute
-            camera_stream_url = self._resolve_camera_stream_url(
-                camera_stream_url, camera_entity.ha_base_url
-            )
+        # Get camera stream URL from HA entity attributes
+        camera_entity = self.ha_entities.get(station.camera_entity_id)
+        if not camera_entity:
+            logger.error("Camera entity %s not found", station.camera_entity_id)
+            return False
 
-            # Import CallStartRequest here to avoid circular imports
-            from proto_gen.callassist.common import MediaCapabilities, Resolution
-            from proto_gen.callassist.plugin import CallStartRequest
-
-            # Create basic media capabilities using correct structure
-            camera_capabilities = MediaCapabilities(
-                video_codecs=["H264", "VP8"],
-                audio_codecs=["OPUS", "PCMU"],
-                supported_resolutions=[
-                    Resolution(width=640, height=480, framerate=10),
-                    Resolution(width=1280, height=720, framerate=30),
-                ],
-                hardware_acceleration=False,
-                webrtc_support=True,
-                max_bandwidth_kbps=2000,
+        # Get camera stream URL and transform to absolute if needed
+        camera_stream_url = camera_entity.attributes.get("stream_source", "")
+        if not camera_stream_url and "entity_picture" in camera_entity.attributes:
+            # Try to construct stream URL from entity picture URL
+            camera_stream_url = camera_entity.attributes["entity_picture"].replace(
+                "/camera_proxy/", "/camera_proxy_stream/"
             )
 
-            player_capabilities = MediaCapabilities(
-                video_codecs=["H264", "VP8", "VP9"],
-                audio_codecs=["OPUS", "AAC"],
-                supported_resolutions=[
-                    Resolution(width=1920, height=1080, framerate=30),
-                    Resolution(width=1280, height=720, framerate=30),
-                ],
-                hardware_acceleration=True,
-                webrtc_support=True,
-                max_bandwidth_kbps=10000,
+        if not camera_stream_url:
+            logger.error(
+                "No stream source found for camera %s", station.camera_entity_id
             )
+            return False
 
-            # Create call start request
-            call_request = CallStartRequest(
-                call_id=call_id,
-                target_address=contact,
-                camera_stream_url=camera_stream_url,
-                camera_capabilities=camera_capabilities,
-                player_capabilities=player_capabilities,
-            )
+        # Ensure camera_stream_url is absolute
+        camera_stream_url = self._resolve_camera_stream_url(
+            camera_stream_url, camera_entity.ha_base_url
+        )
 
-            # Call the plugin manager
-            response = await self.plugin_manager.start_call(protocol, call_request)
+        # Create call start request
+        call_request = CallStartRequest(
+            call_id=call_id,
+            target_address=contact,
+            camera_stream_url=camera_stream_url,
+            camera_capabilities=CAMERA_CAPABILITIES,
+            player_capabilities=PLAYER_CAPABILITIES,
+        )
 
-            if response and response.success:
-                logger.info(f"Plugin call started successfully: {response.message}")
-                return True
-            error_msg = response.message if response else "No response from plugin"
-            logger.error(f"Plugin call failed: {error_msg}")
-            return False
+        # Call the plugin manager
+        response = await self.plugin_manager.start_call(protocol, call_request)
 
-        except Exception as e:
-            logger.error(f"Exception during plugin call initiation: {e}")
-            return False
+        if response and response.success:
+            logger.info("Plugin call started successfully: %s", response.message)
+            return True
+        error_msg = response.message if response else "No response from plugin"
+        logger.error("Plugin call failed: %s", error_msg)
+        return False
 
     def _detect_protocol_from_contact(self, contact: str) -> str:
         """Detect protocol from contact format"""
@@ -39,24 +39,21 @@ class CallStationService:
         stations_with_status = []
 
         for station in call_stations:
+            camera = available_entities.get(station.camera_entity_id)
+            player = available_entities.get(station.media_player_entity_id)
+
             # Check if both entities are available
-            camera_available = (
-                station.camera_entity_id in available_entities
-                and available_entities[station.camera_entity_id].available
-            )
-            player_available = (
-                station.media_player_entity_id in available_entities
-                and available_entities[station.media_player_entity_id].available
-            )
+            camera_available = camera is not None and camera.available
+            player_available = player is not None and player.available
 
             # Get entity names for display
-            if station.camera_entity_id in available_entities:
-                camera_name = available_entities[station.camera_entity_id].name
+            if camera is not None:
+                camera_name = camera.name
             else:
                 camera_name = f"{station.camera_entity_id} (not found)"
 
-            if station.media_player_entity_id in available_entities:
-                player_name = available_entities[station.media_player_entity_id].name
+            if player is not None:
+                player_name = player.name
             else:
                 player_name = f"{station.media_player_entity_id} (not found)"
 
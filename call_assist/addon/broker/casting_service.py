@@ -34,7 +34,7 @@ class CastState(Enum):
     DISCONNECTED = "disconnected"
 
 
-@dataclass
+@dataclass(slots=True)
 class CastTarget:
     """Configuration for a casting target"""
 
@@ -45,7 +45,7 @@ class CastTarget:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CastSession:
     """Information about an active casting session"""
 
@@ -167,19 +167,28 @@ class CastingService:
 
     async def discover_targets(self) -> List[CastTarget]:
         """Discover all available casting targets"""
-        all_targets = []
+        all_targets: List[CastTarget] = []
 
-        for provider in self.providers.values():
-            try:
-                targets = await provider.discover_targets()
-                all_targets.extend(targets)
-                logger.info(
-                    f"Discovered {len(targets)} targets from {provider.provider_name}"
-                )
-            except Exception as e:
+        # Query all providers concurrently; one failing must not hide the others
+        providers = list(self.providers.values())
+        results = await asyncio.gather(
+            *(provider.discover_targets() for provider in providers),
+            return_exceptions=True,
+        )
+
+        for provider, result in zip(providers, results, strict=True):
+            if isinstance(result, Exception):
                 logger.error(
-                    f"Error discovering targets from {provider.provider_name}: {e}"
+                    f"Error discovering targets from {provider.provider_name}: {result}"
                 )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+
+            all_targets.extend(result)
+            logger.info(
+                f"Discovered {len(result)} targets from {provider.provider_name}"
+            )
 
         # Update target registry
         for target in all_targets:
@@ -189,20 +198,18 @@ class CastingService:
 
     async def start_cast(self, target_id: str, call_id: str) -> Optional[str]:
         """Start casting a call to a target"""
-        if target_id not in self.target_registry:
+        target = self.target_registry.get(target_id)
+        if target is None:
             logger.error(f"Cast target {target_id} not found")
             return None
 
-        target = self.target_registry[target_id]
-
-        if target.target_type not in self.providers:
+        provider = self.providers.get(target.target_type)
+        if provider is None:
             logger.error(
                 f"No provider available for target type {target.target_type.value}"
             )
             return None
 
-        provider = self.providers[target.target_type]
-
         try:
             session_id = await provider.start_cast(target, call_id)
             if session_id:
@@ -230,11 +237,11 @@ class CastingService:
 
     async def stop_cast(self, session_id: str) -> bool:
         """Stop a casting session"""
-        if session_id not in self.active_sessions:
+        session = self.active_sessions.get(session_id)
+        if session is None:
             logger.warning(f"Casting session {session_id} not found")
             return False
 
-        session = self.active_sessions[session_id]
         provider = self.providers.get(session.target.target_type)
 
         if not provider:
@@ -249,8 +256,8 @@ class CastingService:
             else:
                 logger.error(f"Failed to stop casting session {session_id}")
 
-            # Remove from active sessions
-            del self.active_sessions[session_id]
+            # Remove from active sessions (a concurrent stop may have beaten us)
+            self.active_sessions.pop(session_id, None)
             return success
 
         except Exception as e:
@@ -2,13 +2,16 @@
 
 import logging
 from pathlib import Path
+from typing import cast
 
-from sqlmodel import Session, SQLModel, create_engine, select
+from sqlmodel import Session, SQLModel, create_engine, func, select
 
-from .models import Account, BrokerSettings, CallLog
+from .data_types import SettingsValueType
+from .models import DEFAULT_SETTINGS, Account, BrokerSettings, CallLog
 from .queries import (
-    get_setting_with_session,
-    save_setting_with_session,
+    bump_data_version,
+    get_settings_with_session,
+    save_settings_with_session,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,20 +44,16 @@ class DatabaseManager:
 
     async def _setup_default_settings(self) -> None:
         """Set up default broker settings if they don't exist"""
-        # Default settings
-        default_settings: dict[str, int | str | bool] = {
-            "web_ui_port": 8080,
-            "web_ui_host": "0.0.0.0",
-            "enable_call_history": True,
-            "max_call_history_days": 30,
-            "auto_cleanup_logs": True,
-        }
-
         with self.get_session() as session:
-            for key, value in default_settings.items():
-                existing_value = get_setting_with_session(session, key)
-                if existing_value is None:
-                    save_setting_with_session(session, key, value)
+            existing = get_settings_with_session(session, DEFAULT_SETTINGS.keys())
+            missing: dict[str, SettingsValueType] = {
+                key: cast(SettingsValueType, value)
+                for key, value in DEFAULT_SETTINGS.items()
+                if key not in existing
+            }
+            if missing:
+                save_settings_with_session(session, missing)
+                for key, value in missing.items():
                     logger.info(f"Set default setting: {key} = {value}")
 
     def get_session(self) -> Session:
@@ -63,9 +62,9 @@ class DatabaseManager:
 
     async def cleanup_old_call_logs(self, days: int = 30) -> None:
         """Clean up call logs older than specified days"""
-        from datetime import datetime, timedelta
+        from datetime import UTC, datetime, timedelta
 
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
         with self.get_session() as session:
             # Delete old call logs
@@ -79,14 +78,20 @@ class DatabaseManager:
             session.commit()
 
             if old_logs:
+                bump_data_version()
                 logger.info(f"Cleaned up {len(old_logs)} old call logs")
 
     async def get_database_stats(self) -> dict[str, int | float | str]:
         """Get database statistics"""
         with self.get_session() as session:
-            account_count = len(session.exec(select(Account)).all())
-            call_log_count = len(session.exec(select(CallLog)).all())
-            settings_count = len(session.exec(select(BrokerSettings)).all())
+            # Count every table in a single query instead of loading the rows
+            account_count, call_log_count, settings_count = session.exec(
+                select(
+                    select(func.count()).select_from(Account).scalar_subquery(),
+                    select(func.count()).select_from(CallLog).scalar_subquery(),
+                    select(func.count()).select_from(BrokerSettings).scalar_subquery(),
+                )
+            ).one()
 
             # Database file size
             db_size_bytes = (
@@ -140,6 +145,7 @@ class DatabaseManager:
 
             # Recreate engine
             self.engine = create_engine(self.database_url, echo=False)
+            bump_data_version()
 
             logger.info(f"Database restored from {backup_file}")
             return True
@@ -4,7 +4,7 @@ Ludic-based web UI components for Call Assist Broker
 """
 
 import traceback
-from typing import Any, Unpack, override
+from typing import Any, Literal, Unpack, override
 
 from ludic import Blank, Component
 from ludic.attrs import GlobalAttrs
@@ -61,6 +61,15 @@ from .data_types import (
     ProtocolSchemaDict,
 )
 
+InputType = Literal["text", "password", "url", "number"]
+
+# HTML input type for each plugin field type; anything else is a text input
+FIELD_INPUT_TYPES: dict[str, InputType] = {
+    "PASSWORD": "password",
+    "URL": "url",
+    "INTEGER": "number",
+}
+
 
 class NavAttrs(GlobalAttrs, total=False):
     data_variant: str
@@ -365,7 +374,7 @@ class AccountForm(Component[NoChildren, GlobalAttrs]):
                 ),
                 *[
                     option(
-                        schema.get("display_name", protocol.title()),
+                        schema.get("display_name") or protocol.title(),
                         value=protocol,
                         selected=protocol == self.selected_protocol,
                     )
@@ -418,46 +427,24 @@ class AccountForm(Component[NoChildren, GlobalAttrs]):
                 if field_name in ["account_id", "display_name"]:
                     continue
 
-                field_type = field_def.get("type", "text")
-                field_label = field_def.get(
-                    "display_name", field_name.replace("_", " ").title()
+                field_type = field_def.get("type", "STRING")
+                field_label = (
+                    field_def.get("display_name")
+                    or field_name.replace("_", " ").title()
                 )
                 field_required = field_def.get("required", False)
                 field_value = self.account_data.get(field_name, "")
 
-                if field_type == "password":
-                    credential_fields.append(label(field_label, for_=field_name))
-                    credential_fields.append(
-                        input(
-                            type="password",
-                            name=field_name,
-                            id=field_name,
-                            value=field_value,
-                            required=field_required,
-                        )
-                    )
-                elif field_type == "url":
-                    credential_fields.append(label(field_label, for_=field_name))
-                    credential_fields.append(
-                        input(
-                            type="url",
-                            name=field_name,
-                            id=field_name,
-                            value=field_value,
-                            required=field_required,
-                        )
-                    )
-                else:
-                    credential_fields.append(label(field_label, for_=field_name))
-                    credential_fields.append(
-                        input(
-                            type="text",
-                            name=field_name,
-                            id=field_name,
-                            value=field_value,
-                            required=field_required,
-                        )
+                credential_fields.append(label(field_label, for_=field_name))
+                credential_fields.append(
+                    input(
+                        type=FIELD_INPUT_TYPES.get(field_type, "text"),
+                        name=field_name,
+                        id=field_name,
+                        value=field_value,
+                        required=field_required,
                     )
+                )
 
             if credential_fields:
                 fields.append(fieldset(legend("Credentials"), *credential_fields))
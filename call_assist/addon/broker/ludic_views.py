@@ -5,7 +5,9 @@ Ludic-based FastAPI views for Call Assist Broker web UI
 Now using FastAPI dependency injection for clean dependency management.
 """
 
+import asyncio
 import logging
+import uuid
 from typing import Annotated
 
 from fastapi import Depends, FastAPI, Form, HTTPException, Path, Request
@@ -31,6 +33,7 @@ from .dependencies import (
     get_plugin_manager,
 )
 from .ludic_components import (
+    FIELD_INPUT_TYPES,
     AccountForm,
     AccountsTable,
     CallHistoryTable,
@@ -49,6 +52,7 @@ from .queries import (
     get_account_by_protocol_and_id_with_session,
     get_call_logs_with_session,
     get_call_station_by_id_with_session,
+    get_data_version,
     save_account_with_session,
     save_call_station_with_session,
 )
@@ -56,6 +60,29 @@ from .settings_service import SettingsService, get_settings_service
 
 logger = logging.getLogger(__name__)
 
+# Static bodies for the HTMX protocol-fields endpoint; each request gets its own
+# Response because FastAPI attaches per-request state (background tasks) to it
+_EMPTY_FIELDS_HTML = ""
+_PROTOCOL_NOT_FOUND_HTML = "<p>Protocol not found</p>"
+
+# Form fields that are account properties rather than plugin credentials
+_ADD_ACCOUNT_RESERVED_FIELDS = frozenset({"protocol", "account_id", "display_name"})
+_EDIT_ACCOUNT_RESERVED_FIELDS = frozenset({"account_id", "display_name"})
+
+# Pages with at least this many table rows are rendered in a worker thread
+THREADED_RENDER_MIN_ROWS = 20
+
+# Pre-rendered pages for the common fresh-install case with no data yet
+_EMPTY_DASHBOARD_HTML = str(
+    PageLayout("Call Assist Broker", AccountsTable(accounts=[]))
+)
+_EMPTY_HISTORY_HTML = str(
+    PageLayout("Call History - Call Assist Broker", CallHistoryTable(call_logs=[]))
+)
+
+# Distinguishes ETags across broker restarts, since the data version resets
+_ETAG_PREFIX = uuid.uuid4().hex[:8]
+
 
 def convert_ha_entities_to_entity_info(
     ha_entities: dict[str, HAEntity],
@@ -72,6 +99,22 @@ def convert_ha_entities_to_entity_info(
     }
 
 
+async def render_layout(layout: PageLayout, row_count: int) -> HTMLResponse:
+    """Render a page layout, keeping large tables off the event loop"""
+    if row_count >= THREADED_RENDER_MIN_ROWS:
+        return HTMLResponse(content=await asyncio.to_thread(str, layout))
+    return HTMLResponse(content=str(layout))
+
+
+def current_etag() -> str:
+    """Weak ETag for pages rendered purely from stored data
+
+    Pages that also show live plugin or broker state must not use this, since
+    that state changes without a database write.
+    """
+    return f'W/"{_ETAG_PREFIX}-v{get_data_version()}"'
+
+
 def create_routes(app: FastAPI) -> None:
     """Create all web UI routes with dependency injection"""
 
@@ -115,10 +158,12 @@ def create_routes(app: FastAPI) -> None:
     @app.get("/ui", response_class=HTMLResponse)
     async def main_page(
         account_service: Annotated[AccountService, Depends(get_account_service)],
-    ) -> PageLayout:
+    ) -> HTMLResponse:
         """Main dashboard page with accounts table"""
         # Get accounts with real-time status checking
         accounts_data = await account_service.get_accounts_with_status()
+        if not accounts_data:
+            return HTMLResponse(content=_EMPTY_DASHBOARD_HTML)
 
         # Format the updated_at field for display
         from dataclasses import replace
@@ -134,9 +179,10 @@ def create_routes(app: FastAPI) -> None:
             )
             formatted_accounts.append(formatted_account)
 
-        return PageLayout(
+        layout = PageLayout(
             "Call Assist Broker", AccountsTable(accounts=formatted_accounts)
         )
+        return await render_layout(layout, len(formatted_accounts))
 
     @app.get("/ui/add-account", response_class=HTMLResponse)
     async def add_account_page(
@@ -163,7 +209,7 @@ def create_routes(app: FastAPI) -> None:
         credentials = {
             key: value
             for key, value in form_data.items()
-            if key not in ["protocol", "account_id", "display_name"]
+            if key not in _ADD_ACCOUNT_RESERVED_FIELDS
         }
 
         # Check if account already exists
@@ -250,7 +296,7 @@ def create_routes(app: FastAPI) -> None:
         credentials = {
             key: value
             for key, value in form_data.items()
-            if key not in ["account_id", "display_name"]
+            if key not in _EDIT_ACCOUNT_RESERVED_FIELDS
         }
 
         # If account_id changed, check if new one already exists
@@ -295,12 +341,12 @@ def create_routes(app: FastAPI) -> None:
         protocol: str | None = None,
     ) -> HTMLResponse:
         """Get protocol-specific form fields for HTMX dynamic loading"""
-        protocols = plugin_manager.get_protocol_schemas()
         if not protocol:
-            return HTMLResponse(content="")
+            return HTMLResponse(content=_EMPTY_FIELDS_HTML)
 
+        protocols = plugin_manager.get_protocol_schemas()
         if protocol not in protocols:
-            return HTMLResponse(content="<p>Protocol not found</p>")
+            return HTMLResponse(content=_PROTOCOL_NOT_FOUND_HTML)
 
         schema = protocols[protocol]
         fields = []
@@ -323,58 +369,27 @@ def create_routes(app: FastAPI) -> None:
         if "credential_fields" in schema:
             for field_config in schema["credential_fields"]:
                 field_name = field_config.get("key")
-                if not field_name or field_name in ["account_id", "display_name"]:
+                if not field_name or field_name in _EDIT_ACCOUNT_RESERVED_FIELDS:
                     continue
 
                 field_type = field_config.get("type", "STRING")
-                field_label = field_config.get(
-                    "display_name", field_name.replace("_", " ").title()
+                field_label = (
+                    field_config.get("display_name")
+                    or field_name.replace("_", " ").title()
                 )
                 field_required = field_config.get("required", False)
                 field_placeholder = field_config.get("placeholder", "")
 
                 credential_fields.append(label(field_label, for_=field_name))
-
-                if field_type == "PASSWORD":
-                    credential_fields.append(
-                        input(
-                            type="password",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
-                    )
-                elif field_type == "URL":
-                    credential_fields.append(
-                        input(
-                            type="url",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
-                    )
-                elif field_type == "INTEGER":
-                    credential_fields.append(
-                        input(
-                            type="number",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
-                    )
-                else:  # STRING
-                    credential_fields.append(
-                        input(
-                            type="text",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
+                credential_fields.append(
+                    input(
+                        type=FIELD_INPUT_TYPES.get(field_type, "text"),
+                        name=field_name,
+                        id=field_name,
+                        placeholder=field_placeholder,
+                        required=field_required,
                     )
+                )
 
         # Protocol-specific setting fields
         setting_fields: list[label | input] = []
@@ -384,54 +399,23 @@ def create_routes(app: FastAPI) -> None:
                 if not field_name:
                     continue
                 field_type = field_config.get("type", "STRING")
-                field_label = field_config.get(
-                    "display_name", field_name.replace("_", " ").title()
+                field_label = (
+                    field_config.get("display_name")
+                    or field_name.replace("_", " ").title()
                 )
                 field_required = field_config.get("required", False)
                 field_placeholder = field_config.get("placeholder", "")
 
                 setting_fields.append(label(field_label, for_=field_name))
-
-                if field_type == "PASSWORD":
-                    setting_fields.append(
-                        input(
-                            type="password",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
-                    )
-                elif field_type == "URL":
-                    setting_fields.append(
-                        input(
-                            type="url",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
-                    )
-                elif field_type == "INTEGER":
-                    setting_fields.append(
-                        input(
-                            type="number",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
-                    )
-                else:  # STRING
-                    setting_fields.append(
-                        input(
-                            type="text",
-                            name=field_name,
-                            id=field_name,
-                            placeholder=field_placeholder,
-                            required=field_required,
-                        )
+                setting_fields.append(
+                    input(
+                        type=FIELD_INPUT_TYPES.get(field_type, "text"),
+                        name=field_name,
+                        id=field_name,
+                        placeholder=field_placeholder,
+                        required=field_required,
                     )
+                )
 
         if credential_fields:
             fields.append(fieldset(legend("Credentials"), *credential_fields))
@@ -457,7 +441,7 @@ def create_routes(app: FastAPI) -> None:
             broker_status = {
                 "status": "Running",
                 "active_calls": len(getattr(broker, "active_calls", [])),
-                "configured_accounts": len(getattr(broker, "account_credentials", {})),
+                "configured_accounts": db_stats["accounts"],
                 "available_protocols": ", ".join(
                     plugin_manager.get_available_protocols()
                 ),
@@ -474,10 +458,18 @@ def create_routes(app: FastAPI) -> None:
 
     @app.get("/ui/history", response_class=HTMLResponse)
     async def history_page(
+        request: Request,
         session: Annotated[Session, Depends(get_database_session)],
-    ) -> PageLayout:
+    ) -> Response:
         """Call history page"""
+        etag = current_etag()
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
         call_logs = get_call_logs_with_session(session)
+        if not call_logs:
+            return HTMLResponse(content=_EMPTY_HISTORY_HTML, headers={"ETag": etag})
+
         logs_data = []
 
         for log in call_logs:
@@ -497,9 +489,12 @@ def create_routes(app: FastAPI) -> None:
                 }
             )
 
-        return PageLayout(
+        layout = PageLayout(
             "Call History - Call Assist Broker", CallHistoryTable(call_logs=logs_data)
         )
+        response = await render_layout(layout, len(logs_data))
+        response.headers["ETag"] = etag
+        return response
 
     @app.get("/ui/settings", response_class=HTMLResponse)
     async def settings_page(
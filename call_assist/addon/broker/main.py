@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
 
+from grpclib.config import Configuration
 from grpclib.server import Server
 
 from addon.broker.broker import CallAssistBroker
@@ -11,6 +13,18 @@ from addon.broker.web_server import WebUIServer
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 tuning for the long-lived entity streams to Home Assistant: wider
+# flow-control windows and keepalive pings so idle connections stay warm.
+GRPC_SERVER_CONFIG = Configuration(
+    _keepalive_time=30.0,
+    _keepalive_timeout=10.0,
+    _keepalive_permit_without_calls=True,
+    _http2_max_pings_without_data=0,
+    _http2_min_sent_ping_interval_without_data=10.0,
+    http2_connection_window_size=8 * 1024 * 1024,
+    http2_stream_window_size=8 * 1024 * 1024,
+)
+
 
 async def serve(
     grpc_host: str = "0.0.0.0",
@@ -48,7 +62,9 @@ async def serve(
 
     try:
         # Initialize gRPC server with broker and video service
-        grpc_server = Server([broker, video_service])  # grpclib server
+        grpc_server = Server(  # grpclib server
+            [broker, video_service], config=GRPC_SERVER_CONFIG
+        )
 
         logger.info("Starting Call Assist Broker:")
         logger.info(f"  - gRPC server: {grpc_host}:{grpc_port}")
@@ -106,8 +122,17 @@ if __name__ == "__main__":
     # Set up logging
     logging.basicConfig(level=logging.INFO)
 
+    # Use uvloop's libuv-based event loop; it is unavailable on Windows
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=loop_factory)
     except KeyboardInterrupt:
         logger.info("Broker shutdown complete")
     except Exception as e:
@@ -6,6 +6,8 @@ from typing import cast
 
 from sqlmodel import Field, SQLModel
 
+from addon.broker.data_types import BrokerSettingsDict
+
 
 class Account(SQLModel, table=True):
     """SQLModel for account credentials storage"""
@@ -37,7 +39,7 @@ class Account(SQLModel, table=True):
     @property
     def unique_key(self) -> str:
         """Generate unique key for this account"""
-        return f"{self.protocol}_{hash(self.account_id)}"
+        return f"{self.protocol}:{self.account_id}"
 
 
 class BrokerSettings(SQLModel, table=True):
@@ -70,6 +72,16 @@ class BrokerSettings(SQLModel, table=True):
         self.set_value(val)
 
 
+# Settings stored on first startup, and used for any key missing from the database
+DEFAULT_SETTINGS: BrokerSettingsDict = {
+    "web_ui_port": 8080,
+    "web_ui_host": "0.0.0.0",
+    "enable_call_history": True,
+    "max_call_history_days": 30,
+    "auto_cleanup_logs": True,
+}
+
+
 class CallLog(SQLModel, table=True):
     """SQLModel for call history logging"""
 
@@ -125,4 +137,4 @@ class CallStation(SQLModel, table=True):
     @property
     def unique_key(self) -> str:
         """Generate unique key for this call station"""
-        return f"station_{hash(self.station_id)}"
+        return f"station_{self.station_id}"
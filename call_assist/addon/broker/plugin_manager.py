@@ -9,8 +9,8 @@ import socket
 import subprocess
 import sys
 import threading
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from types import FrameType
@@ -45,6 +45,16 @@ class PluginState(Enum):
     ERROR = "error"
 
 
+# Credential names containing any of these are treated as secrets
+SENSITIVE_KEY_WORDS = ("password", "token", "secret", "key")
+
+
+def _is_sensitive_key(name: str) -> bool:
+    """Check whether a credential name looks like a secret"""
+    lowered = name.lower()
+    return any(word in lowered for word in SENSITIVE_KEY_WORDS)
+
+
 @dataclass
 class FieldDefinition(JsonSchemaMixin):
     """Definition for a credential or setting field with UI metadata"""
@@ -137,19 +147,9 @@ class PluginMetadata(JsonSchemaMixin):
                     key=cred,
                     display_name=cred.replace("_", " ").title(),
                     description=f"Enter your {cred.replace('_', ' ')}",
-                    type=(
-                        "PASSWORD"
-                        if any(
-                            secret_word in cred.lower()
-                            for secret_word in ["password", "token", "secret", "key"]
-                        )
-                        else "STRING"
-                    ),
+                    type="PASSWORD" if _is_sensitive_key(cred) else "STRING",
                     required=True,
-                    sensitive=any(
-                        secret_word in cred.lower()
-                        for secret_word in ["password", "token", "secret", "key"]
-                    ),
+                    sensitive=_is_sensitive_key(cred),
                 )
                 for cred in self.required_credentials
             ]
@@ -167,18 +167,17 @@ class PluginMetadata(JsonSchemaMixin):
             ]
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginConfiguration:
     """Configuration state for an initialized plugin"""
 
     protocol: str
     credentials: dict[str, str]
     settings: dict[str, str]
-    initialized_at: str | None = None  # ISO timestamp
-    is_initialized: bool = True
+    initialized_at: float | None = None  # Unix timestamp, format when displayed
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginInstance:
     metadata: PluginMetadata
     plugin_dir: str
@@ -188,6 +187,8 @@ class PluginInstance:
     state: PluginState = PluginState.STOPPED
     last_error: str | None = None
     configuration: PluginConfiguration | None = None
+    # Set whenever a start attempt finishes, successfully or not
+    startup_finished: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 class PluginManager:
@@ -200,7 +201,13 @@ class PluginManager:
             plugins_root = str(current_dir.parent / "plugins")
         self.plugins_root = plugins_root
         self.plugins: dict[str, PluginInstance] = {}
+        # Protocol names only change on discovery, so keep them as a tuple
+        self._available_protocols: tuple[str, ...] = ()
+        # UI schemas are built from static metadata once per discovery
+        self._protocol_schemas: dict[str, ProtocolSchemaDict] = {}
         self._shutdown_requested = False
+        # Serializes plugin startup from port selection until the port is bound
+        self._startup_lock = asyncio.Lock()
 
         # Register cleanup handlers
         atexit.register(self._emergency_cleanup)
@@ -316,6 +323,8 @@ class PluginManager:
                     f"Failed to load plugin metadata from {metadata_file}: {e}"
                 )
 
+        self._available_protocols = tuple(self.plugins)
+        self._protocol_schemas = self._build_protocol_schemas()
         logger.info(f"Plugin discovery complete. Found {len(self.plugins)} plugins")
 
     def _load_plugin_metadata(self, metadata_file: str) -> PluginMetadata:
@@ -360,78 +369,81 @@ class PluginManager:
         self, plugin: PluginInstance, timeout: int
     ) -> bool:
         """Wait for plugin to finish starting up"""
-        for _ in range(timeout):
-            await asyncio.sleep(1)
-            # Check if plugin has finished starting
-            if plugin.state == PluginState.RUNNING:
-                return True
-            if plugin.state == PluginState.ERROR:
-                return False
+        try:
+            await asyncio.wait_for(plugin.startup_finished.wait(), timeout)
+        except TimeoutError:
+            logger.error(f"Plugin {plugin.metadata.protocol} timed out during startup")
+            return False
 
-        logger.error(f"Plugin {plugin.metadata.protocol} timed out during startup")
-        return False
+        return plugin.state == PluginState.RUNNING
 
     async def _start_plugin(self, plugin: PluginInstance) -> bool:
         """Start a plugin process based on its metadata"""
         logger.info(f"Starting plugin: {plugin.metadata.name}")
         plugin.state = PluginState.STARTING
+        plugin.startup_finished.clear()
 
         try:
-            # Find an available port for this plugin
-            available_port = self._find_available_port()
-            logger.info(
-                f"Assigned port {available_port} to plugin {plugin.metadata.name}"
-            )
+            # Hold the lock until the plugin answers on its port, so a
+            # concurrent start cannot pick the same port before it is bound
+            async with self._startup_lock:
+                # Find an available port for this plugin
+                available_port = self._find_available_port()
+                logger.info(
+                    f"Assigned port {available_port} to plugin {plugin.metadata.name}"
+                )
 
-            # Update the plugin's gRPC configuration with the new port
-            plugin.metadata.grpc.port = available_port
-
-            # Build command from metadata
-            exec_config = plugin.metadata.executable
-            command = exec_config.command
-            working_dir = str(Path(plugin.plugin_dir) / exec_config.working_directory)
-
-            # Set up environment variables
-            env = os.environ.copy()
-            env["PORT"] = str(available_port)
-
-            # Start the plugin process - pipe output to same console
-            plugin.process = subprocess.Popen(
-                command,
-                stdout=None,  # Inherit stdout from parent process
-                stderr=None,  # Inherit stderr from parent process
-                cwd=working_dir,
-                env=env,
-            )
+                # Update the plugin's gRPC configuration with the new port
+                plugin.metadata.grpc.port = available_port
 
-            # Wait for plugin to start up
-            await asyncio.sleep(0.2)
+                # Build command from metadata
+                exec_config = plugin.metadata.executable
+                command = exec_config.command
+                working_dir = str(
+                    Path(plugin.plugin_dir) / exec_config.working_directory
+                )
 
-            # Check if process is still running
-            if plugin.process.poll() is not None:
-                exit_code = plugin.process.returncode
-                raise RuntimeError(f"Plugin process exited with code {exit_code}")
+                # Set up environment variables
+                env = os.environ.copy()
+                env["PORT"] = str(available_port)
+
+                # Start the plugin process - pipe output to same console
+                plugin.process = subprocess.Popen(
+                    command,
+                    stdout=None,  # Inherit stdout from parent process
+                    stderr=None,  # Inherit stderr from parent process
+                    cwd=working_dir,
+                    env=env,
+                )
 
-            # Establish gRPC connection
-            port = plugin.metadata.grpc.port
-            plugin.channel = Channel(host="localhost", port=port)
-            plugin.stub = CallPluginStub(plugin.channel)
+                # Wait for plugin to start up
+                await asyncio.sleep(0.2)
 
-            # Wait for gRPC server to be ready
-            health_timeout = plugin.metadata.grpc.health_check_timeout
-            for attempt in range(health_timeout * 2):  # 0.5s intervals
-                try:
-                    await asyncio.wait_for(
-                        plugin.stub.get_health(
-                            betterproto_lib_pydantic_google_protobuf.Empty()
-                        ),
-                        timeout=1.0,
-                    )
-                    break
-                except (TimeoutError, Exception):
-                    if attempt == (health_timeout * 2 - 1):
-                        raise
-                    await asyncio.sleep(0.5)
+                # Check if process is still running
+                if plugin.process.poll() is not None:
+                    exit_code = plugin.process.returncode
+                    raise RuntimeError(f"Plugin process exited with code {exit_code}")
+
+                # Establish gRPC connection
+                port = plugin.metadata.grpc.port
+                plugin.channel = Channel(host="localhost", port=port)
+                plugin.stub = CallPluginStub(plugin.channel)
+
+                # Wait for gRPC server to be ready
+                health_timeout = plugin.metadata.grpc.health_check_timeout
+                for attempt in range(health_timeout * 2):  # 0.5s intervals
+                    try:
+                        await asyncio.wait_for(
+                            plugin.stub.get_health(
+                                betterproto_lib_pydantic_google_protobuf.Empty()
+                            ),
+                            timeout=1.0,
+                        )
+                        break
+                    except (TimeoutError, Exception):
+                        if attempt == (health_timeout * 2 - 1):
+                            raise
+                        await asyncio.sleep(0.5)
 
             plugin.state = PluginState.RUNNING
             logger.info(f"Plugin {plugin.metadata.protocol} started successfully")
@@ -444,6 +456,10 @@ class PluginManager:
             await self._cleanup_plugin(plugin)
             return False
 
+        finally:
+            # Wake anyone waiting in _wait_for_plugin_startup
+            plugin.startup_finished.set()
+
     async def _stop_plugin(self, plugin: PluginInstance) -> None:
         """Stop a running plugin"""
         if plugin.state == PluginState.STOPPED:
@@ -514,6 +530,17 @@ class PluginManager:
         except (TimeoutError, GRPCError, ConnectionError, OSError):
             return False
 
+    async def _get_stub(self, protocol: str) -> CallPluginStub | None:
+        """Get the cached stub for a protocol, starting the plugin if necessary.
+
+        The channel and stub are created once when the plugin process starts
+        and reused for every subsequent call until the plugin is stopped.
+        """
+        if not await self.ensure_plugin_running(protocol):
+            return None
+
+        return self.plugins[protocol].stub
+
     async def initialize_plugin(
         self,
         protocol: str,
@@ -521,12 +548,11 @@ class PluginManager:
         settings: dict[str, str] | None = None,
     ) -> bool:
         """Initialize a plugin with credentials"""
-        if not await self.ensure_plugin_running(protocol):
+        stub = await self._get_stub(protocol)
+        if not stub:
             return False
 
         plugin = self.plugins[protocol]
-        if not plugin.stub:
-            return False
 
         # Validate required credentials
         missing_creds = []
@@ -549,14 +575,14 @@ class PluginManager:
                 settings=settings or {},
             )
 
-            response = await plugin.stub.initialize(config)
+            response = await stub.initialize(config)
 
             if response.initialized:
                 plugin.configuration = PluginConfiguration(
                     protocol=protocol,
                     credentials=credentials,
                     settings=settings or {},
-                    initialized_at=datetime.now().isoformat(),
+                    initialized_at=time.time(),
                 )
                 logger.info(f"Plugin {protocol} initialized successfully")
                 return True
@@ -571,15 +597,12 @@ class PluginManager:
         self, protocol: str, call_request: CallStartRequest
     ) -> CallStartResponse | None:
         """Start a call using the specified protocol plugin"""
-        if not await self.ensure_plugin_running(protocol):
-            return None
-
-        plugin = self.plugins[protocol]
-        if not plugin.stub:
+        stub = await self._get_stub(protocol)
+        if not stub:
             return None
 
         try:
-            return await plugin.stub.start_call(call_request)
+            return await stub.start_call(call_request)
         except (TimeoutError, GRPCError, ConnectionError, OSError) as e:
             logger.error(f"Failed to start call on {protocol}: {e}")
             return None
@@ -608,21 +631,19 @@ class PluginManager:
 
         return self.plugins[protocol].metadata.capabilities
 
-    def get_available_protocols(self) -> list[str]:
-        """Get list of available protocol plugins"""
-        return list(self.plugins.keys())
+    def get_available_protocols(self) -> tuple[str, ...]:
+        """Get the available protocol plugins"""
+        return self._available_protocols
 
     def get_plugin_state(self, protocol: str) -> PluginState | None:
         """Get the current state of a plugin"""
-        if protocol in self.plugins:
-            return self.plugins[protocol].state
-        return None
+        plugin = self.plugins.get(protocol)
+        return plugin.state if plugin else None
 
     def get_plugin_info(self, protocol: str) -> PluginMetadata | None:
         """Get plugin metadata"""
-        if protocol in self.plugins:
-            return self.plugins[protocol].metadata
-        return None
+        plugin = self.plugins.get(protocol)
+        return plugin.metadata if plugin else None
 
     async def initialize_plugin_account(
         self,
@@ -632,12 +653,11 @@ class PluginManager:
         credentials: dict[str, str],
     ) -> bool:
         """Initialize a plugin account with specific account details"""
-        if not await self.ensure_plugin_running(protocol):
+        stub = await self._get_stub(protocol)
+        if not stub:
             return False
 
         plugin = self.plugins[protocol]
-        if not plugin.stub:
-            return False
 
         # Validate required credentials
         missing_creds = []
@@ -660,14 +680,14 @@ class PluginManager:
                 settings={},
             )
 
-            response = await plugin.stub.initialize(config)
+            response = await stub.initialize(config)
 
             if response.initialized:
                 plugin.configuration = PluginConfiguration(
                     protocol=protocol,
                     credentials=credentials,
                     settings={},
-                    initialized_at=datetime.now().isoformat(),
+                    initialized_at=time.time(),
                 )
                 logger.info(
                     f"Plugin {protocol} account {account_id} initialized successfully"
@@ -695,7 +715,11 @@ class PluginManager:
         return None
 
     def get_protocol_schemas(self) -> dict[str, ProtocolSchemaDict]:
-        """Get UI schemas for all available protocols"""
+        """Get UI schemas for all available protocols (shared, do not modify)"""
+        return self._protocol_schemas
+
+    def _build_protocol_schemas(self) -> dict[str, ProtocolSchemaDict]:
+        """Build UI schemas from the discovered plugin metadata"""
         schemas: dict[str, ProtocolSchemaDict] = {}
 
         for protocol, plugin_instance in self.plugins.items():
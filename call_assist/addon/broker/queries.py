@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
 import logging
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime
 from typing import TypeVar, overload
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from addon.broker.data_types import SettingsValueType
 from addon.broker.models import (
@@ -16,6 +17,20 @@ from addon.broker.models import (
 
 logger = logging.getLogger(__name__)
 
+# Incremented on every write so read-only views can tell when data is unchanged
+_data_version = 0
+
+
+def get_data_version() -> int:
+    """Get the current data version, which changes after every write"""
+    return _data_version
+
+
+def bump_data_version() -> None:
+    """Record that stored data has changed"""
+    global _data_version
+    _data_version += 1
+
 
 # Session-based query functions for dependency injection
 
@@ -51,7 +66,27 @@ def get_setting_with_session(
     setting = session.exec(
         select(BrokerSettings).where(BrokerSettings.key == key)
     ).first()
-    return setting.get_value() if setting else default
+    value = setting.get_value() if setting else None
+    return default if value is None else value
+
+
+def get_settings_with_session(
+    session: Session, keys: Iterable[str]
+) -> dict[str, SettingsValueType]:
+    """Get several setting values in one query using provided session
+
+    Only keys with a stored value are returned, so callers can fall back to
+    their own defaults for anything missing.
+    """
+    settings = session.exec(
+        select(BrokerSettings).where(col(BrokerSettings.key).in_(list(keys)))
+    ).all()
+    values: dict[str, SettingsValueType] = {}
+    for setting in settings:
+        value = setting.get_value()
+        if value is not None:
+            values[setting.key] = value
+    return values
 
 
 def save_setting_with_session(
@@ -71,10 +106,37 @@ def save_setting_with_session(
         session.add(setting)
 
     session.commit()
+    bump_data_version()
     session.refresh(setting)
     return setting
 
 
+def save_settings_with_session(
+    session: Session, settings: Mapping[str, SettingsValueType]
+) -> None:
+    """Save several setting values with one lookup and one commit"""
+    existing = {
+        setting.key: setting
+        for setting in session.exec(
+            select(BrokerSettings).where(col(BrokerSettings.key).in_(list(settings)))
+        ).all()
+    }
+
+    now = datetime.now(UTC)
+    for key, value in settings.items():
+        setting = existing.get(key)
+        if setting:
+            setting.set_value(value)
+            setting.updated_at = now
+        else:
+            setting = BrokerSettings(key=key, value_json="{}")
+            setting.set_value(value)
+            session.add(setting)
+
+    session.commit()
+    bump_data_version()
+
+
 def get_accounts_by_protocol_with_session(
     session: Session, protocol: str
 ) -> list[Account]:
@@ -101,10 +163,12 @@ def save_account_with_session(session: Session, account: Account) -> Account:
         existing.credentials_json = account.credentials_json
         existing.updated_at = datetime.now(UTC)
         session.commit()
+        bump_data_version()
         session.refresh(existing)
         return existing
     session.add(account)
     session.commit()
+    bump_data_version()
     session.refresh(account)
     return account
 
@@ -122,6 +186,7 @@ def delete_account_with_session(
     if account:
         session.delete(account)
         session.commit()
+        bump_data_version()
         return True
     return False
 
@@ -148,6 +213,7 @@ def log_call_start_with_session(
 
     session.add(call_log)
     session.commit()
+    bump_data_version()
     session.refresh(call_log)
     return call_log
 
@@ -164,6 +230,7 @@ def update_call_log_with_session(
         if error_message:
             call_log.error_message = error_message
         session.commit()
+        bump_data_version()
         session.refresh(call_log)
         return call_log
 
@@ -219,10 +286,12 @@ def save_call_station_with_session(
         existing.enabled = call_station.enabled
         existing.updated_at = datetime.now(UTC)
         session.commit()
+        bump_data_version()
         session.refresh(existing)
         return existing
     session.add(call_station)
     session.commit()
+    bump_data_version()
     session.refresh(call_station)
     return call_station
 
@@ -236,5 +305,6 @@ def delete_call_station_with_session(session: Session, station_id: str) -> bool:
     if call_station:
         session.delete(call_station)
         session.commit()
+        bump_data_version()
         return True
     return False
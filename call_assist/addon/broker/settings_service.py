@@ -4,16 +4,19 @@ Settings service module for managing broker settings with dependency injection.
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, cast
 
 from fastapi import Depends
 from sqlmodel import Session
 
 from addon.broker.data_types import BrokerSettingsDict, SettingsValueType
 from addon.broker.dependencies import get_database_session
+from addon.broker.models import DEFAULT_SETTINGS
 from addon.broker.queries import (
     get_setting_with_session,
+    get_settings_with_session,
     save_setting_with_session,
+    save_settings_with_session,
 )
 
 logger = logging.getLogger(__name__)
@@ -26,28 +29,14 @@ class SettingsService:
         self.session = session
 
     async def get_all_settings(self) -> BrokerSettingsDict:
-        """Get all current settings"""
-        return {
-            "web_ui_port": get_setting_with_session(self.session, "web_ui_port", 8080),
-            "web_ui_host": get_setting_with_session(
-                self.session, "web_ui_host", "0.0.0.0"
-            ),
-            "enable_call_history": get_setting_with_session(
-                self.session, "enable_call_history", True
-            ),
-            "max_call_history_days": get_setting_with_session(
-                self.session, "max_call_history_days", 30
-            ),
-            "auto_cleanup_logs": get_setting_with_session(
-                self.session, "auto_cleanup_logs", True
-            ),
-        }
+        """Get all current settings, using defaults for any that are not stored"""
+        stored = get_settings_with_session(self.session, DEFAULT_SETTINGS.keys())
+        return cast(BrokerSettingsDict, {**DEFAULT_SETTINGS, **stored})
 
     async def update_settings(self, settings: dict[str, SettingsValueType]) -> bool:
         """Update settings"""
         try:
-            for key, value in settings.items():
-                save_setting_with_session(self.session, key, value)
+            save_settings_with_session(self.session, settings)
             logger.info(f"Updated {len(settings)} settings")
             return True
         except (OSError, ValueError, TypeError) as e:
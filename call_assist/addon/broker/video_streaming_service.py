@@ -20,7 +20,7 @@ from proto_gen.callassist.plugin import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoStreamInfo:
     """Information about an active video stream"""
 
@@ -32,7 +32,7 @@ class VideoStreamInfo:
     frame_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoFrame:
     """A video frame with metadata"""
 
@@ -46,7 +46,7 @@ class VideoFrame:
     rotation: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamStats:
     """Statistics for a single video stream"""
 
@@ -55,7 +55,7 @@ class StreamStats:
     last_frame_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoStreamingStats:
     """Overall video streaming statistics"""
 
@@ -129,13 +129,17 @@ class VideoStreamingService(CallPluginBase):
                 stream_info = self.active_streams[frame.call_id]
                 if stream_info.frame_count % 100 == 0:  # Log every 100 frames
                     logger.info(
-                        f"Processed {stream_info.frame_count} frames for call {frame.call_id} "
-                        f"({frame.width}x{frame.height}, {frame.format})"
+                        "Processed %d frames for call %s (%dx%d, %s)",
+                        stream_info.frame_count,
+                        frame.call_id,
+                        frame.width,
+                        frame.height,
+                        frame.format,
                     )
 
         except Exception as e:
             logger.error(
-                f"Error handling video frame for call {frame_msg.call_id}: {e}"
+                "Error handling video frame for call %s: %s", frame_msg.call_id, e
             )
 
     async def _update_stream_info(self, frame: VideoFrame) -> None:
@@ -177,10 +181,11 @@ class VideoStreamingService(CallPluginBase):
                 queue.put_nowait(frame)
             except asyncio.QueueFull:
                 logger.warning(
-                    f"Frame subscriber queue full, dropping frame for call {frame.call_id}"
+                    "Frame subscriber queue full, dropping frame for call %s",
+                    frame.call_id,
                 )
             except Exception as e:
-                logger.error(f"Error notifying frame subscriber: {e}")
+                logger.error("Error notifying frame subscriber: %s", e)
 
     def subscribe_to_frames(self) -> asyncio.Queue[VideoFrame]:
         """Subscribe to receive video frames (for casting services)"""
@@ -223,8 +228,7 @@ class VideoStreamingService(CallPluginBase):
         for call_id in inactive_calls:
             logger.info(f"Cleaning up inactive video stream for call {call_id}")
             del self.active_streams[call_id]
-            if call_id in self.recent_frames:
-                del self.recent_frames[call_id]
+            self.recent_frames.pop(call_id, None)
 
     async def start_cleanup_task(self) -> None:
         """Start background task to clean up inactive streams"""
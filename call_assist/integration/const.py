@@ -10,5 +10,8 @@ CONF_PORT = "port"
 DEFAULT_HOST = "devcontainer"
 DEFAULT_PORT = 50051
 
+# Seconds to wait for more state changes before streaming them to the broker
+ENTITY_UPDATE_COALESCE_DELAY = 0.05
+
 # Monitored domains in Home Assistant
 MONITORED_DOMAINS = ["camera", "media_player"]
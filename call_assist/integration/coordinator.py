@@ -13,11 +13,17 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, MONITORED_DOMAINS
+from .const import DOMAIN, ENTITY_UPDATE_COALESCE_DELAY, MONITORED_DOMAINS
 from .grpc_client import CallAssistGrpcClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -51,6 +57,10 @@ class CallAssistCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
 
         # Tasks for streaming
         self._broker_stream_task: asyncio.Task[None] | None = None
+        self._entity_flush_task: asyncio.Task[None] | None = None
+
+        # Latest state per entity, waiting to be streamed to the broker
+        self._pending_entity_states: dict[str, State] = {}
 
         # State change listener
         self._state_change_listener: Callable[[], None] | None = None
@@ -90,6 +100,11 @@ class CallAssistCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
             with contextlib.suppress(asyncio.CancelledError):
                 await self._broker_stream_task
 
+        if self._entity_flush_task:
+            self._entity_flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._entity_flush_task
+
         # Remove state change listener
         if self._state_change_listener:
             self._state_change_listener()
@@ -149,8 +164,12 @@ class CallAssistCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
 
         new_state = event.data["new_state"]
         if new_state:
-            # Schedule entity update and batch send
-            asyncio.create_task(self._handle_entity_update(entity_id, new_state))
+            # Keep only the latest state and let one task stream the burst
+            self._pending_entity_states[entity_id] = new_state
+            if self._entity_flush_task is None or self._entity_flush_task.done():
+                self._entity_flush_task = asyncio.create_task(
+                    self._flush_entity_updates()
+                )
 
     async def _send_entity_update(self, entity_id: str, state: Any) -> None:
         """Send entity update to broker."""
@@ -182,12 +201,16 @@ class CallAssistCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
         # Send to broker via stream (handled by streaming task)
         await self.grpc_client.send_ha_entity_update(entity_update)
 
-    async def _handle_entity_update(self, entity_id: str, state: Any) -> None:
-        """Handle entity update by queuing it and sending batch."""
-        # Queue the entity update
-        await self._send_entity_update(entity_id, state)
-        # Send the batch (single entity in this case)
-        await self._send_entity_batch()
+    async def _flush_entity_updates(self) -> None:
+        """Stream pending entity updates to broker, coalescing bursts."""
+        while self._pending_entity_states:
+            await asyncio.sleep(ENTITY_UPDATE_COALESCE_DELAY)
+            pending = self._pending_entity_states
+            self._pending_entity_states = {}
+
+            for entity_id, state in pending.items():
+                await self._send_entity_update(entity_id, state)
+            await self._send_entity_batch()
 
     async def _send_entity_batch(self) -> None:
         """Send queued entity updates to broker as a batch."""
@@ -222,10 +245,10 @@ class CallAssistCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
                     "name": entity_update.name,
                     "type": entity_update.entity_type,
                     "state": entity_update.state,
-                    "attributes": dict(entity_update.attributes),
+                    "attributes": entity_update.attributes,
                     "icon": entity_update.icon,
                     "available": entity_update.available,
-                    "capabilities": list(entity_update.capabilities),
+                    "capabilities": entity_update.capabilities,
                     "last_updated": entity_update.last_updated,
                 }
 
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for call station state across broker call station rebuilds
+"""
+
+import logging
+import shutil
+import tempfile
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from addon.broker.broker import CallAssistBroker, HAEntity
+from addon.broker.database import DatabaseManager
+from addon.broker.models import CallStation as CallStationConfig
+from addon.broker.queries import (
+    save_call_station_with_session,
+    save_setting_with_session,
+)
+
+logger = logging.getLogger(__name__)
+
+STATION_ID = "front_door_station"
+CAMERA_ID = "camera.front_door"
+PLAYER_ID = "media_player.living_room"
+
+
+def _ha_entity(entity_id: str, available: bool = True) -> HAEntity:
+    """Build an HA entity as received from the integration stream"""
+    return HAEntity(
+        entity_id=entity_id,
+        domain=entity_id.split(".", 1)[0],
+        name=entity_id,
+        state="idle",
+        attributes={},
+        available=available,
+        last_updated=datetime.now(UTC),
+        ha_base_url="http://homeassistant.local:8123",
+    )
+
+
+@pytest.fixture
+async def broker() -> AsyncIterator[CallAssistBroker]:
+    """Broker backed by a temporary database holding one call station"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        db_manager = DatabaseManager(str(Path(temp_dir) / "broker.db"))
+        await db_manager.initialize()
+
+        with db_manager.get_session() as session:
+            session.add(
+                CallStationConfig(
+                    station_id=STATION_ID,
+                    display_name="Front Door Station",
+                    camera_entity_id=CAMERA_ID,
+                    media_player_entity_id=PLAYER_ID,
+                )
+            )
+            session.commit()
+
+        broker = CallAssistBroker(plugin_manager=Mock(), database_manager=db_manager)
+        broker.ha_entities[CAMERA_ID] = _ha_entity(CAMERA_ID)
+        broker.ha_entities[PLAYER_ID] = _ha_entity(PLAYER_ID)
+        await broker._update_call_stations()
+
+        yield broker
+
+        db_manager.engine.dispose()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestCallStationState:
+    """Tests that rebuilding call stations keeps their call state"""
+
+    @pytest.mark.asyncio
+    async def test_state_survives_rebuild_after_database_write(
+        self, broker: CallAssistBroker
+    ) -> None:
+        """An unrelated database write does not reset a station mid-call"""
+        station = broker.call_stations[STATION_ID]
+        station.state = "calling"
+
+        assert broker.database_manager is not None
+        with broker.database_manager.get_session() as session:
+            save_setting_with_session(session, "max_call_history_days", 14)
+
+        await broker._update_call_stations()
+
+        assert broker.call_stations[STATION_ID] is station
+        assert broker.call_stations[STATION_ID].state == "calling"
+
+    @pytest.mark.asyncio
+    async def test_state_survives_availability_change(
+        self, broker: CallAssistBroker
+    ) -> None:
+        """A station losing its camera keeps its call state"""
+        station = broker.call_stations[STATION_ID]
+        station.state = "calling"
+
+        broker.ha_entities[CAMERA_ID] = _ha_entity(CAMERA_ID, available=False)
+        await broker._update_call_stations()
+
+        assert broker.call_stations[STATION_ID] is station
+        assert not station.available
+        assert station.state == "calling"
+
+    @pytest.mark.asyncio
+    async def test_state_survives_station_reconfiguration(
+        self, broker: CallAssistBroker
+    ) -> None:
+        """Editing a station's configuration keeps its call state"""
+        broker.call_stations[STATION_ID].state = "calling"
+
+        assert broker.database_manager is not None
+        with broker.database_manager.get_session() as session:
+            save_call_station_with_session(
+                session,
+                CallStationConfig(
+                    station_id=STATION_ID,
+                    display_name="Porch Station",
+                    camera_entity_id=CAMERA_ID,
+                    media_player_entity_id=PLAYER_ID,
+                ),
+            )
+
+        await broker._update_call_stations()
+
+        assert broker.call_stations[STATION_ID].name == "Porch Station"
+        assert broker.call_stations[STATION_ID].state == "calling"
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for plugin startup in the plugin manager
+"""
+
+import asyncio
+import logging
+import socket
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from addon.broker.plugin_manager import (
+    CapabilitiesConfig,
+    ExecutableConfig,
+    GrpcConfig,
+    PluginInstance,
+    PluginManager,
+    PluginMetadata,
+    PluginState,
+    ResolutionConfig,
+)
+from proto_gen.callassist.common import HealthStatus
+
+logger = logging.getLogger(__name__)
+
+# How long a fake plugin process takes to bind its port after being spawned
+FAKE_BIND_DELAY = 0.5
+
+
+def _make_plugin(protocol: str, plugins_root: str) -> PluginInstance:
+    """Build an in-memory plugin instance for the given protocol"""
+    return PluginInstance(
+        metadata=PluginMetadata(
+            name=f"{protocol.title()} Plugin",
+            protocol=protocol,
+            executable=ExecutableConfig(type="python", command=["fake-plugin"]),
+            grpc=GrpcConfig(port=0),
+            capabilities=CapabilitiesConfig(
+                video_codecs=["VP8"],
+                audio_codecs=["OPUS"],
+                supported_resolutions=[
+                    ResolutionConfig(width=640, height=480, framerate=30)
+                ],
+                webrtc_support=True,
+            ),
+        ),
+        plugin_dir=str(Path(plugins_root) / protocol),
+    )
+
+
+class FakePluginServers:
+    """Stands in for plugin processes that bind their port some time after spawn"""
+
+    def __init__(self) -> None:
+        self.sockets: dict[int, socket.socket] = {}
+        self.owners: dict[int, str] = {}
+
+    def popen(
+        self, command: list[str], *, cwd: str, env: dict[str, str], **_: object
+    ) -> Mock:
+        """Fake subprocess.Popen that binds PORT after FAKE_BIND_DELAY"""
+        del command
+        port = int(env["PORT"])
+        # Each fake plugin runs from a directory named after its protocol
+        protocol = Path(cwd).name
+
+        def bind() -> None:
+            if port in self.sockets:
+                # A second plugin trying to serve the same port fails to start
+                return
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("localhost", port))
+            sock.listen()
+            self.sockets[port] = sock
+            self.owners[port] = protocol
+
+        asyncio.get_running_loop().call_later(FAKE_BIND_DELAY, bind)
+
+        process = Mock()
+        process.poll.return_value = None
+        return process
+
+    def channel(self, host: str, port: int) -> Mock:
+        """Fake grpclib Channel that remembers which port it targets"""
+        del host
+        channel = Mock()
+        channel.port = port
+        return channel
+
+    def stub(self, channel: Mock) -> Mock:
+        """Fake plugin stub whose health check answers for the bound server"""
+
+        async def get_health(_: object) -> HealthStatus:
+            owner = self.owners.get(channel.port)
+            if owner is None:
+                raise ConnectionRefusedError(channel.port)
+            return HealthStatus(healthy=True, component=owner)
+
+        stub = Mock()
+        stub.get_health = get_health
+        return stub
+
+    def close(self) -> None:
+        for sock in self.sockets.values():
+            sock.close()
+
+
+@pytest.fixture
+def fake_servers() -> Iterator[FakePluginServers]:
+    servers = FakePluginServers()
+    try:
+        yield servers
+    finally:
+        servers.close()
+
+
+class TestConcurrentPluginStartup:
+    """Tests for starting several plugins at the same time"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_starts_get_distinct_ports(
+        self, fake_servers: FakePluginServers
+    ) -> None:
+        """Two protocols started together each get and reach their own port"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pm = PluginManager(plugins_root=temp_dir)
+            for protocol in ("matrix", "xmpp"):
+                pm.plugins[protocol] = _make_plugin(protocol, temp_dir)
+
+            with (
+                patch(
+                    "addon.broker.plugin_manager.subprocess.Popen", fake_servers.popen
+                ),
+                patch("addon.broker.plugin_manager.Channel", fake_servers.channel),
+                patch("addon.broker.plugin_manager.CallPluginStub", fake_servers.stub),
+            ):
+                results = await asyncio.gather(
+                    pm.ensure_plugin_running("matrix"),
+                    pm.ensure_plugin_running("xmpp"),
+                )
+
+            assert all(results)
+
+            ports = {
+                protocol: plugin.metadata.grpc.port
+                for protocol, plugin in pm.plugins.items()
+            }
+            logger.info(f"Assigned plugin ports: {ports}")
+            assert ports["matrix"] != ports["xmpp"]
+
+            # Each plugin's port is served by that plugin and not the other one
+            for protocol, port in ports.items():
+                assert fake_servers.owners[port] == protocol
+                assert pm.plugins[protocol].state == PluginState.RUNNING
+
+            # Don't let the manager try to terminate the fake processes at exit
+            pm._shutdown_requested = True
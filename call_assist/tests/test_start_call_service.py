@@ -2,16 +2,23 @@
 """Test for the start_call service functionality"""
 
 import logging
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from grpclib.client import Channel
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+from grpclib.server import Server
 
+from addon.broker.broker import CallAssistBroker, CallStation, HAEntity
 from proto_gen.callassist.broker import (
     BrokerIntegrationStub,
     StartCallRequest,
     StartCallResponse,
 )
 
+from .conftest import find_available_port
 from .types import BrokerProcessInfo
 
 logger = logging.getLogger(__name__)
@@ -72,3 +79,56 @@ async def test_start_call_invalid_station_via_grpc(
 
     finally:
         channel.close()
+
+
+@pytest.mark.asyncio
+async def test_start_call_plugin_error_returns_internal_status() -> None:
+    """Test that an unexpected plugin error surfaces as a gRPC INTERNAL status"""
+    plugin_manager = Mock()
+    plugin_manager.start_call = AsyncMock(side_effect=RuntimeError("plugin crashed"))
+
+    broker = CallAssistBroker(plugin_manager=plugin_manager)
+    broker.ha_entities["camera.front_door"] = HAEntity(
+        entity_id="camera.front_door",
+        domain="camera",
+        name="Front Door",
+        state="idle",
+        attributes={"stream_source": "rtsp://camera.local/stream"},
+        available=True,
+        last_updated=datetime.now(UTC),
+        ha_base_url="http://homeassistant.local:8123",
+    )
+    station = CallStation(
+        station_id="front_door_station",
+        name="Front Door Station",
+        camera_entity_id="camera.front_door",
+        media_player_entity_id="media_player.living_room",
+    )
+    broker.call_stations[station.station_id] = station
+
+    grpc_port = find_available_port()
+    server = Server([broker])
+    await server.start("localhost", grpc_port)
+
+    channel = Channel("localhost", grpc_port)
+    stub = BrokerIntegrationStub(channel)
+
+    try:
+        with pytest.raises(GRPCError) as exc_info:
+            await stub.start_call(
+                StartCallRequest(
+                    call_station_id=station.station_id,
+                    contact="@test_user:matrix.org",
+                )
+            )
+
+        assert exc_info.value.status == Status.INTERNAL
+        assert "plugin crashed" in (exc_info.value.message or "")
+        assert station.state == "idle"
+
+        logger.info(f"✅ Plugin error surfaced as {exc_info.value.status}")
+
+    finally:
+        channel.close()
+        server.close()
+        await server.wait_closed()
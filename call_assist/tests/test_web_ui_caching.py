@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for conditional GET (ETag / 304) handling in the web UI
+"""
+
+import logging
+import shutil
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from addon.broker.database import DatabaseManager
+from addon.broker.models import CallLog
+from addon.broker.queries import get_data_version
+
+from .conftest import WebUITestClient
+
+logger = logging.getLogger(__name__)
+
+
+async def _get(
+    web_ui_client: WebUITestClient, path: str, etag: str | None = None
+) -> aiohttp.ClientResponse:
+    """GET a page, optionally revalidating it with a previously seen ETag"""
+    assert web_ui_client.session is not None
+    headers = {"If-None-Match": etag} if etag else {}
+    async with web_ui_client.session.get(
+        f"{web_ui_client.base_url}{path}", headers=headers
+    ) as resp:
+        await resp.read()
+        return resp
+
+
+class TestWebUICaching:
+    """Tests for ETag revalidation of database-backed pages"""
+
+    @pytest.mark.asyncio
+    async def test_history_page_not_modified_until_data_changes(
+        self, web_ui_client: WebUITestClient
+    ) -> None:
+        """History page returns 304 for a current ETag and 200 after a write"""
+        first = await _get(web_ui_client, "/ui/history")
+        assert first.status == 200
+        etag = first.headers.get("ETag")
+        assert etag, "History page should send an ETag"
+
+        revalidated = await _get(web_ui_client, "/ui/history", etag)
+        assert revalidated.status == 304
+
+        # Any database write must invalidate the tag
+        assert web_ui_client.session is not None
+        async with web_ui_client.session.post(
+            f"{web_ui_client.base_url}/ui/settings",
+            data={
+                "web_ui_host": "0.0.0.0",
+                "web_ui_port": "8080",
+                "enable_call_history": "true",
+                "max_call_history_days": "30",
+                "auto_cleanup_logs": "true",
+            },
+            allow_redirects=False,
+        ) as resp:
+            assert resp.status == 302
+
+        changed = await _get(web_ui_client, "/ui/history", etag)
+        assert changed.status == 200
+        assert changed.headers.get("ETag") != etag
+
+    @pytest.mark.asyncio
+    async def test_live_status_pages_are_not_cached(
+        self, web_ui_client: WebUITestClient
+    ) -> None:
+        """Pages showing live plugin state never send an ETag"""
+        for path in ("/ui", "/ui/status"):
+            resp = await _get(web_ui_client, path)
+            assert resp.status == 200
+            assert "ETag" not in resp.headers, f"{path} should not be cached"
+
+
+class TestDataVersionInvalidation:
+    """Tests that maintenance operations invalidate cached pages"""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_and_restore_bump_data_version(self) -> None:
+        """Deleting old call logs and restoring a backup change the version"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            db_manager = DatabaseManager(str(Path(temp_dir) / "broker.db"))
+            await db_manager.initialize()
+
+            with db_manager.get_session() as session:
+                session.add(
+                    CallLog(
+                        call_id="old_call",
+                        protocol="matrix",
+                        account_id="@test:example.com",
+                        target_address="@friend:example.com",
+                        camera_entity_id="camera.front_door",
+                        media_player_entity_id="media_player.living_room",
+                        start_time=datetime.now(UTC) - timedelta(days=60),
+                        final_state="ended",
+                    )
+                )
+                session.commit()
+
+            before_cleanup = get_data_version()
+            await db_manager.cleanup_old_call_logs(days=30)
+            assert get_data_version() != before_cleanup
+
+            backup_path = str(Path(temp_dir) / "backup.db")
+            assert await db_manager.backup_database(backup_path)
+
+            before_restore = get_data_version()
+            assert await db_manager.restore_database(backup_path)
+            assert get_data_version() != before_restore
+
+            db_manager.engine.dispose()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)